@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+"""PDF processing for both challenge rounds.
+
+Round 1A: extract a document title plus an H1-H3 outline from each PDF,
+based on font-size heuristics.
+Round 1B: persona-driven analysis - rank document sections by relevance
+to a persona and their job-to-be-done.
+"""
+
+import functools
+import hashlib
+import heapq
+import json
+import os
+import queue
+import re
+import sys
+import threading
+from array import array
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+
+import fitz
+import numpy as np
+
+try:  # orjson encodes in C; fall back to stdlib json when unavailable
+    import orjson
+except ImportError:
+    orjson = None
+
+# Word tokens used for relevance scoring; short words carry no signal.
+_TOKEN_RE = re.compile(r"[a-z]{4,}")
+
+# Sentence boundaries for subsection chunking; finditer yields offsets so
+# text is sliced once per emitted subsection, not once per sentence.
+_SENT_RE = re.compile(r"[^.!?]+[.!?](?:\s+|$)")
+
+_STOP_WORDS = frozenset({
+    "the", "a", "an", "and", "or", "but", "in", "on", "at", "to",
+    "for", "of", "with", "by", "from", "about", "that", "this",
+    "will", "are", "was", "were", "been", "have", "has", "had",
+})
+
+
+@functools.lru_cache(maxsize=1024)
+def _extract_keywords_cached(text):
+    """Deduped keywords for a text, memoized - persona/job strings repeat.
+
+    dict.fromkeys dedupes in one hash-table pass while keeping input
+    order, so the cached value is deterministic run to run.
+    """
+    words = (w.strip(".,!?()[]{}").lower() for w in text.split())
+    return tuple(dict.fromkeys(w for w in words if len(w) > 3 and w not in _STOP_WORDS))
+
+# One open fitz.Document per path, shared between outline extraction and
+# persona analysis so each PDF pays the font/CMap load cost once per run.
+_DOC_CACHE = {}
+
+
+def _open_document(path):
+    """Open a PDF once per process; repeat callers share the handle."""
+    key = os.path.abspath(str(path))
+    doc = _DOC_CACHE.get(key)
+    if doc is None:
+        doc = _DOC_CACHE[key] = fitz.open(key)
+    return doc
+
+
+def _release_document(path):
+    """Close and drop a cached document once all consumers are done."""
+    doc = _DOC_CACHE.pop(os.path.abspath(str(path)), None)
+    if doc is not None:
+        doc.close()
+
+
+class PDFOutlineExtractor:
+    """Extracts title and hierarchical outline from a PDF."""
+
+    def extract_outline(self, pdf):
+        """Extract from a path or an already-open fitz.Document.
+
+        Paths go through the shared document cache; pass the same path to
+        the persona analyzer and the PDF is only parsed once. Callers own
+        the document lifetime (see _release_document).
+        """
+        doc = pdf if hasattr(pdf, "load_page") else _open_document(pdf)
+        title = self._extract_title(doc)
+        outline = self._extract_headings(doc)
+        return {"title": title, "outline": outline}
+
+    def _extract_title(self, doc):
+        """Take the largest-font span near the top of the first page."""
+        if len(doc) == 0:
+            return "Untitled Document"
+        page = doc[0]
+        # Clip extraction to the top strip so PyMuPDF never materializes
+        # spans below it, rather than filtering on bbox afterwards.
+        clip = fitz.Rect(0, 0, page.rect.width, 200)
+        blocks = page.get_text(
+            "dict", clip=clip, flags=fitz.TEXTFLAGS_TEXT & ~fitz.TEXT_PRESERVE_IMAGES
+        )["blocks"]
+        best_size = 0.0
+        best_text = None
+        for block in blocks:
+            if "lines" not in block:
+                continue
+            for line in block["lines"]:
+                for span in line["spans"]:
+                    text = span["text"].strip()
+                    if text and span["size"] > best_size:
+                        best_size = span["size"]
+                        best_text = text
+        return best_text or "Untitled Document"
+
+    def _extract_headings(self, doc):
+        """Collect headings in a single pass over the document.
+
+        Each line's size feeds an online Counter histogram while the line
+        itself goes into a compact buffer; after the pass the top three
+        font sizes become H1-H3 and the buffered lines are re-emitted.
+        Avoids materializing every page's text dict twice.
+        """
+        # Text-only flags: skip image and graphics operators that the
+        # heading heuristics never look at.
+        flags = fitz.TEXTFLAGS_TEXT & ~fitz.TEXT_PRESERVE_IMAGES
+        # Unboxed float storage: 4 bytes per size vs a PyFloat per span,
+        # with rounding/dedupe done in one numpy pass after the walk.
+        font_sizes = array("f")
+        lines = []
+        for page_num in range(len(doc)):
+            page = doc[page_num]
+            for block in page.get_text("dict", flags=flags)["blocks"]:
+                if "lines" not in block:
+                    continue
+                for line in block["lines"]:
+                    spans = line["spans"]
+                    if not spans:
+                        continue
+                    line_text = "".join(span["text"] for span in spans).strip()
+                    if not line_text or len(line_text) >= 200 or line_text.endswith("."):
+                        continue
+                    font_sizes.append(max(span["size"] for span in spans))
+                    lines.append((line_text, page_num + 1))
+
+        if not font_sizes:
+            return []
+        rounded = np.round(np.frombuffer(font_sizes, dtype=np.float32) * 4) / 4
+        sizes, counts = np.unique(rounded, return_counts=True)
+        body_size = sizes[np.argmax(counts)]
+        heading_sizes = sorted((float(s) for s in sizes if s > body_size), reverse=True)[:3]
+        size_to_level = {s: f"H{i + 1}" for i, s in enumerate(heading_sizes)}
+
+        outline = []
+        for size, (text, page) in zip(rounded.tolist(), lines):
+            level = size_to_level.get(size)
+            if level:
+                outline.append({"level": level, "text": text, "page": page})
+        return outline
+
+
+@dataclass(slots=True)
+class Section:
+    """One extracted section; slotted to avoid a per-instance dict in the
+    per-page hot loops, materialized into plain dicts only at JSON time."""
+
+    title: str
+    content: str
+    page: int
+    document: str = ""
+
+
+def _list_pdfs(input_dir):
+    """Sorted PDF paths from one scandir pass.
+
+    scandir reads file type from the directory entry itself, avoiding the
+    per-file stat and Path construction that Path.glob does.
+    """
+    with os.scandir(input_dir) as it:
+        paths = [e.path for e in it if e.is_file() and e.name.lower().endswith(".pdf")]
+    paths.sort()
+    return paths
+
+
+def _truncate(text, limit=500):
+    """Return text unchanged when short enough; slice only when needed."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+class PersonaDrivenAnalyzer:
+    """Ranks document sections by relevance to a persona and job."""
+
+    def analyze_documents(self, input_dir, persona, job):
+        pdf_files = _list_pdfs(input_dir)
+
+        def iter_sections():
+            for pdf_file in pdf_files:
+                yield from self._extract_document_content(pdf_file)
+
+        relevant = self._find_relevant_sections(iter_sections(), persona, job)
+        return {
+            "metadata": {
+                "input_documents": [os.path.basename(p) for p in pdf_files],
+                "persona": persona,
+                "job_to_be_done": job,
+                "processing_timestamp": datetime.now().isoformat(),
+            },
+            "extracted_sections": [
+                {
+                    "document": s.document,
+                    "section_title": s.title or "Untitled Section",
+                    "importance_rank": rank + 1,
+                    "page_number": s.page,
+                }
+                for rank, s in enumerate(relevant)
+            ],
+            "subsection_analysis": [
+                {
+                    "document": s.document,
+                    "refined_text": _truncate(sub),
+                    "page_number": s.page,
+                }
+                for s in relevant
+                for sub in self._extract_subsections(s.content) or (s.content,)
+            ],
+        }
+
+    def _extract_document_content(self, pdf_path, doc=None):
+        if doc is None:
+            doc = _open_document(pdf_path)
+        name = Path(pdf_path).name
+        for page_num in range(len(doc)):
+            text = doc[page_num].get_text(flags=fitz.TEXT_PRESERVE_WHITESPACE)
+            for section in self._split_into_sections(text, page_num + 1):
+                section.document = name
+                yield section
+
+    def _split_into_sections(self, text, page_num):
+        """Split page text into sections at heading-looking paragraphs."""
+        sections = []
+        current_title = ""
+        current_parts = []
+        for para in text.split("\n\n"):
+            para = para.strip()
+            if not para:
+                continue
+            # Cheap guards first; the case scans are bounded to the first
+            # 32 chars - a real heading is recognizable from its prefix.
+            head = para[:32]
+            if len(para) < 100 and not para.endswith(".") and (head.isupper() or head.istitle()):
+                if current_parts:
+                    sections.append(Section(current_title, "\n\n".join(current_parts), page_num))
+                current_title = para
+                current_parts = []
+            else:
+                current_parts.append(para)
+        if current_parts:
+            sections.append(Section(current_title, "\n\n".join(current_parts), page_num))
+        return sections
+
+    def _extract_subsections(self, content):
+        """Chunk section content into ~200 char subsections on sentence ends."""
+        subsections = []
+        start = 0
+        for match in _SENT_RE.finditer(content):
+            if match.end() - start > 200:
+                subsections.append(content[start:match.end()].strip())
+                start = match.end()
+        tail = content[start:].strip()
+        if tail:
+            subsections.append(tail)
+        return subsections
+
+    def _extract_keywords(self, text):
+        """Pull out non-stopword keywords longer than three characters."""
+        return list(_extract_keywords_cached(text))
+
+    @staticmethod
+    def _compile_phrase_pattern(text):
+        """Compile a single \b-anchored alternation of bigram phrases.
+
+        Word-token intersections miss multi-word phrases, so those are
+        matched with one compiled regex scanned linearly per section.
+        """
+        words = _TOKEN_RE.findall(text.lower())
+        phrases = dict.fromkeys(" ".join(p) for p in zip(words, words[1:]))
+        if not phrases:
+            return None
+        return re.compile(r"\b(?:" + "|".join(map(re.escape, phrases)) + r")\b")
+
+    def _find_relevant_sections(self, documents_content, persona, job, top_k=20):
+        persona_set = frozenset(_extract_keywords_cached(persona.lower()))
+        job_set = frozenset(_extract_keywords_cached(job.lower()))
+        job_phrase_re = self._compile_phrase_pattern(job)
+
+        # Bounded min-heap of the current top_k: peak memory stays O(top_k)
+        # while sections stream in from the extraction generators.
+        heap = []
+        seq = 0
+        for section in documents_content:
+            # One tokenization per section, then C-level set intersections,
+            # instead of a substring scan per keyword.
+            content_lower = section.content.lower()
+            tokens = frozenset(_TOKEN_RE.findall(content_lower))
+            title_tokens = frozenset(_TOKEN_RE.findall(section.title.lower()))
+            persona_score = len(tokens & persona_set)
+            job_score = 2 * len(tokens & job_set)
+            title_score = 3 * len(title_tokens & job_set)
+            phrase_score = 0
+            if job_phrase_re is not None:
+                phrase_score = 2 * len(job_phrase_re.findall(content_lower))
+            score = persona_score + job_score + title_score + phrase_score
+            if score > 0:
+                heapq.heappush(heap, (score, -seq, section))
+                if len(heap) > top_k:
+                    heapq.heappop(heap)
+            seq += 1
+        heap.sort(key=lambda item: (-item[0], -item[1]))
+        return [section for _, _, section in heap]
+
+
+def _write_json(output_path, result):
+    """Write a result dict as indented JSON, via orjson when available."""
+    if orjson is not None:
+        Path(output_path).write_bytes(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+
+
+def _fingerprint(pdf_path):
+    """Cache key for a PDF: path plus mtime plus size."""
+    stat = os.stat(pdf_path)
+    return hashlib.sha1(f"{pdf_path}:{stat.st_mtime}:{stat.st_size}".encode()).hexdigest()
+
+
+def _encode_one(pdf_path):
+    """Worker: extract one PDF's outline and return it as encoded JSON.
+
+    Top-level so it pickles for ProcessPoolExecutor; writing is left to
+    the parent's writer thread.
+    """
+    result = PDFOutlineExtractor().extract_outline(pdf_path)
+    _release_document(pdf_path)
+    if orjson is not None:
+        return orjson.dumps(result, option=orjson.OPT_INDENT_2)
+    return json.dumps(result, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _drain_writes(writer_q):
+    """Writer-thread target: flush (path, bytes) pairs as they arrive."""
+    while True:
+        item = writer_q.get()
+        if item is None:
+            return
+        path, data = item
+        Path(path).write_bytes(data)
+
+
+def process_round_1a(input_dir, output_dir):
+    """Extract an outline JSON for every PDF in input_dir, one worker per core."""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    cache_dir = output_dir / ".cache"
+    cache_dir.mkdir(exist_ok=True)
+    pdf_files = _list_pdfs(input_dir)
+    # One writer thread owns all output IO so extraction of the next PDF
+    # overlaps with the disk flush of the previous one.
+    writer_q = queue.Queue(maxsize=32)
+    writer = threading.Thread(target=_drain_writes, args=(writer_q,), daemon=True)
+    writer.start()
+    try:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = {}
+            for path in pdf_files:
+                stem = os.path.splitext(os.path.basename(path))[0]
+                out = str(output_dir / f"{stem}.json")
+                cache_file = cache_dir / f"{_fingerprint(path)}.json"
+                if cache_file.exists():
+                    writer_q.put((out, cache_file.read_bytes()))
+                    print(f"Processed {os.path.basename(path)} (cached)")
+                    continue
+                futures[executor.submit(_encode_one, path)] = (path, out, cache_file)
+            for future in as_completed(futures):
+                path, out, cache_file = futures[future]
+                data = future.result()
+                writer_q.put((out, data))
+                writer_q.put((str(cache_file), data))
+                print(f"Processed {os.path.basename(path)}")
+    finally:
+        writer_q.put(None)
+        writer.join()
+
+
+def process_round_1b(input_dir, output_dir, persona, job):
+    """Run the persona-driven analysis over every PDF in input_dir."""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    analyzer = PersonaDrivenAnalyzer()
+    result = analyzer.analyze_documents(input_dir, persona, job)
+    output_file = output_dir / "challenge1b_output.json"
+    _write_json(output_file, result)
+    print(f"Wrote {output_file}")
+
+
+def main():
+    input_dir = sys.argv[1] if len(sys.argv) > 1 else "input"
+    output_dir = sys.argv[2] if len(sys.argv) > 2 else "output"
+    process_round_1a(input_dir, output_dir)
+
+
+if __name__ == "__main__":
+    main()